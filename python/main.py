@@ -1,13 +1,13 @@
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse, JSONResponse, HTMLResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import FileResponse, JSONResponse, HTMLResponse, Response
 from typing import List, Any
 from pathlib import Path
 import sqlite3
 import json
-import os
 import time
 from zen import ZenEngine
 from jdm_parser import build_py_handler
+from test_data import TestDataCatalog
 
 root = Path(__file__).resolve().parent.parent
 
@@ -73,6 +73,7 @@ def loader(key: str) -> bytes:
     return row[0].encode('utf-8')
 
 engine = ZenEngine({'loader': loader})
+catalog = TestDataCatalog(root / 'test-data')
 app = FastAPI()
 
 @app.get('/')
@@ -115,15 +116,18 @@ async def benchmark_test_data_page():
 # -------- Test data endpoints --------
 @app.get('/test-data')
 async def list_test_data():
-    files = [f for f in os.listdir(root / 'test-data') if f.endswith('.json')]
-    return JSONResponse(files)
+    return JSONResponse(catalog.list())
 
 @app.get('/test-data/{name}')
-async def get_test_data(name: str):
-    path = root / 'test-data' / name
-    if not path.exists():
+async def get_test_data(name: str, request: Request):
+    try:
+        entry = catalog.get(name)
+    except OSError:
         raise HTTPException(status_code=404, detail='Not found')
-    return FileResponse(path, media_type='application/json')
+    headers = {'ETag': entry.etag, 'Cache-Control': 'no-cache'}
+    if entry.etag in request.headers.get('if-none-match', ''):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.raw, media_type='application/json', headers=headers)
 
 # -------- Rule management --------
 @app.post('/rulesets')
@@ -192,12 +196,13 @@ async def benchmark_test_data(body: dict):
     file = body.get('file')
     if not isinstance(parts, list) or not file:
         raise HTTPException(status_code=400, detail='parts and file are required')
-    text = (root / 'test-data' / file).read_text()
-    jdm = json.loads(text)
-    decision = engine.create_decision(jdm)
-    decision.validate()
     try:
-        handler = build_py_handler(jdm)
+        entry = catalog.get(file)
+    except OSError:
+        raise HTTPException(status_code=404, detail='Not found')
+    decision = entry.decision(engine)
+    try:
+        handler = entry.handler()
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
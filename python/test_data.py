@@ -0,0 +1,100 @@
+from typing import Any, Callable, Dict, List, Tuple
+from pathlib import Path
+import hashlib
+import json
+import mmap
+import os
+from jdm_parser import build_py_handler
+
+
+class TestDataEntry:
+    """A single test-data file, kept in memory until its mtime or size changes."""
+
+    def __init__(self, path: Path, stamp: Tuple[int, int], raw: Any, digest: str):
+        self.path = path
+        self.stamp = stamp
+        self.raw = raw
+        self.digest = digest
+        self.etag = f'"{digest}"'
+        self._jdm: Dict[str, Any] | None = None
+        self._decision: Any = None
+        self._handler: Callable[[Dict[str, Any]], Dict[str, Any]] | None = None
+        self._handler_error: str | None = None
+        self._compiled = False
+
+    @property
+    def jdm(self) -> Dict[str, Any]:
+        if self._jdm is None:
+            self._jdm = json.loads(bytes(self.raw))
+        return self._jdm
+
+    def decision(self, engine) -> Any:
+        if self._decision is None:
+            decision = engine.create_decision(self.jdm)
+            decision.validate()
+            self._decision = decision
+        return self._decision
+
+    def handler(self) -> Callable[[Dict[str, Any]], Dict[str, Any]] | None:
+        if not self._compiled:
+            try:
+                self._handler = build_py_handler(self.jdm)
+            except ValueError as e:
+                self._handler_error = str(e)
+            self._compiled = True
+        if self._handler_error is not None:
+            raise ValueError(self._handler_error)
+        return self._handler
+
+    def adopt(self, other: 'TestDataEntry') -> None:
+        # Content is unchanged (e.g. the file was only touched), keep compiled artifacts
+        self._jdm = other._jdm
+        self._decision = other._decision
+        self._handler = other._handler
+        self._handler_error = other._handler_error
+        self._compiled = other._compiled
+
+
+class TestDataCatalog:
+    """Loads each test-data file once and reuses the parsed JDM and compiled handlers."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._entries: Dict[str, TestDataEntry] = {}
+        self._listing: List[str] = []
+        self._listing_stamp: int | None = None
+
+    def list(self) -> List[str]:
+        stamp = os.stat(self.directory).st_mtime_ns
+        if stamp != self._listing_stamp:
+            self._listing = sorted(f for f in os.listdir(self.directory) if f.endswith('.json'))
+            self._listing_stamp = stamp
+        return self._listing
+
+    def get(self, name: str) -> TestDataEntry:
+        if not name or name != os.path.basename(name) or name in ('.', '..'):
+            raise FileNotFoundError(name)
+        path = self.directory / name
+        st = os.stat(path)
+        if not os.path.isfile(path):
+            raise FileNotFoundError(name)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._entries.get(name)
+        if cached is not None and cached.stamp == stamp:
+            return cached
+        entry = self._load(path, stamp)
+        if cached is not None and cached.digest == entry.digest:
+            entry.adopt(cached)
+        self._entries[name] = entry
+        return entry
+
+    def _load(self, path: Path, stamp: Tuple[int, int]) -> TestDataEntry:
+        with open(path, 'rb') as f:
+            if stamp[1] == 0:
+                raw: Any = b''
+            else:
+                # The mapping stays valid after the file is closed; old mappings are
+                # released once no response still references them.
+                raw = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        digest = hashlib.sha256(raw).hexdigest()
+        return TestDataEntry(path, stamp, raw, digest)